@@ -1,21 +1,166 @@
 #!/usr/bin/env python3
 
 import argparse
+import hashlib
+import heapq
+import io
 import json
+import os
+import pickle
+import re
 import subprocess
 import sys
-from collections import defaultdict
-from datetime import datetime
+import time
+import urllib.request
+import zlib
+from collections import Counter, defaultdict, namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date, datetime
+from functools import lru_cache, partial
 from pathlib import Path
+from types import MappingProxyType
+
+try:
+    # orjson decodes the large gh/GraphQL payloads several times faster; its
+    # JSONDecodeError subclasses json.JSONDecodeError
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Configuration passed to every git invocation. Reading the commit-graph
+# (written by main before history scans) lets git skip parsing commit objects.
+GIT_CONFIG_ARGS = ["-c", "core.commitGraph=true"]
+
+# Oldest git (major, minor) that supports --diff-merges=first-parent, which
+# --include-merges uses to diff merge commits against their first parent
+MIN_GIT_VERSION_FOR_MERGES = (2, 31)
+
+# GitHub GraphQL endpoint used for the platform summary
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Results collected for each GraphQL search before paging stops (GitHub's
+# search API doesn't return more than 1000 matches per query anyway)
+GITHUB_SEARCH_LIMIT = 1000
+
+# Default limit on the size of the diffs shown for each file in the commit
+# report, in bytes of UTF-8 (0 means no limit)
+DEFAULT_MAX_DIFF_BYTES = 256 * 1024
+
+# Maximum number of gh/glab queries run at the same time
+CLI_QUERY_WORKERS = 8
+
+# Read buffer used when streaming git output (e.g. git log -p)
+GIT_STREAM_BUFFER_SIZE = 1 << 20
+
+# Write buffer used when streaming a report into its output file
+REPORT_BUFFER_SIZE = 1 << 20
+
+# Directory holding cached commit report data, and the version of its
+# format (bump when the cached structures change)
+CACHE_DIR = Path.home() / ".cache" / "git_report_gen"
+_CACHE_VERSION = 9
+
+# Number of cached commit reports kept; the least recently used are removed
+CACHE_MAX_ENTRIES = 10
+
+# Seconds for which fetched issue and PR/MR statistics are reused
+PLATFORM_CACHE_TTL = 900
+
+# How a file's net status in the period changes when a commit adds (A),
+# deletes (D) or modifies (M) it, keyed by (current status, change) and applied
+# oldest commit first. Pairs not listed keep the current status: a new file
+# stays added when modified, a modified file stays modified. A file added and
+# then deleted nets out to None, and one deleted and then re-added to modified.
+_FILE_STATUS_TRANSITIONS = {
+    (None, "A"): "A",
+    (None, "D"): "D",
+    (None, "M"): "M",
+    ("A", "D"): None,
+    ("M", "D"): "D",
+    ("D", "A"): "M",
+}
+
+# Extended diff header lines whose values depend on the file's other
+# contents, so they don't count towards recognizing a repeated change
+_DIFF_HEADER_UNDIGESTED = ("index ", "similarity index ", "dissimilarity index ")
+
+# Human-readable descriptions of the time ranges listed in the help text
+PERIOD_DESCRIPTIONS = MappingProxyType(
+    {
+        "1.week": "Last 7 days",
+        "2.weeks": "Last 14 days",
+        "1.month": "Last 30 days",
+        "2.months": "Last 60 days",
+        "3.months": "Last 90 days",
+        "6.months": "Last 180 days",
+        "1.year": "Last 365 days",
+    }
+)
+
+# Translation table removing dots, used to put time ranges in file names
+_NO_DOT = str.maketrans("", "", ".")
+
+# Number of days in each unit accepted in time ranges (e.g. "2.weeks")
+_UNIT_DAYS = {
+    "day": 1,
+    "days": 1,
+    "week": 7,
+    "weeks": 7,
+    "month": 30,
+    "months": 30,
+    "year": 365,
+    "years": 365,
+}
+
+# A commit in the commit report; time is its author date as a Unix timestamp
+CommitRecord = namedtuple("CommitRecord", ["hash", "subject", "time"])
+
+# Remote URL forms understood by get_repo_url: HTTP(S) with optional
+# credentials, ssh:// or git:// URLs, and scp-like user@host:path remotes
+_REMOTE_URL_RE = re.compile(
+    r"""
+    ^(?:
+        (?P<scheme>https?)://(?:[^@/]+@)?(?P<web_host>[^/]+)/
+      | (?:ssh|git)://(?:[^@/]+@)?(?P<ssh_host>[^/:]+)(?::\d+)?/
+      | [^@/:]+@(?P<scp_host>[^/:]+):
+    )
+    (?P<path>.+?)(?:\.git)?/?$
+    """,
+    re.VERBOSE,
+)
+
+# Relative times printed by the GitLab CLI (e.g. "about 18 hours ago") and the
+# number of days in each of their units
+_RELATIVE_TIME_RE = re.compile(r"(\d+)\s*(hour|day|week|month|year)")
+_RELATIVE_UNIT_DAYS = {
+    "hour": 1 / 24,
+    "day": 1,
+    "week": 7,
+    "month": 30,
+    "year": 365,
+}
 
 
 def run_git_command(repo_path, *args):
-    """Run a git command in the specified repository."""
+    """Run a git command in the specified repository.
+
+    Results are memoized: git output does not change during a run, so
+    repeated calls (e.g. reading the remote URL) reuse the first result.
+    The cache is keyed on the absolute repository path, so the same
+    repository reached through different relative paths shares entries.
+    """
+    return _run_git_cached(os.path.abspath(repo_path), args)
+
+
+@lru_cache(maxsize=256)
+def _run_git_cached(repo_path, args):
+    """Run a git command for run_git_command and memoize its output."""
     try:
         result = subprocess.run(
-            ["git", "-C", repo_path] + list(args),
+            ["git", "-C", repo_path] + GIT_CONFIG_ARGS + list(args),
             capture_output=True,
-            text=True,
+            encoding="utf-8",
+            errors="replace",
             check=True,
         )
         return result.stdout.strip()
@@ -24,6 +169,47 @@ def run_git_command(repo_path, *args):
         return None
 
 
+def get_git_version(repo_path):
+    """Return git's version as a (major, minor) tuple, or None if unknown."""
+    output = run_git_command(repo_path, "version")
+    match = re.match(r"git version (\d+)\.(\d+)", output or "")
+    if not match:
+        return None
+    return int(match.group(1)), int(match.group(2))
+
+
+def run_git_stream(repo_path, *args, check=False):
+    """Run a git command in the specified repository and yield its output lines.
+
+    Unlike run_git_command, the output is never held in memory as a whole,
+    so callers can parse large logs and patches as git produces them. Bytes
+    that aren't valid UTF-8 (e.g. patches of Latin-1 files) are replaced
+    rather than aborting the report. With check set, a failing command
+    raises CalledProcessError once all of its output has been yielded.
+    """
+    cmd = ["git", "-C", repo_path] + GIT_CONFIG_ARGS + list(args)
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        encoding="utf-8",
+        errors="replace",
+        bufsize=GIT_STREAM_BUFFER_SIZE,
+    )
+    try:
+        for line in proc.stdout:
+            yield line.rstrip("\n")
+    finally:
+        proc.stdout.close()
+        returncode = proc.wait()
+
+    if returncode != 0:
+        e = subprocess.CalledProcessError(returncode, cmd)
+        print(f"Error running git command: {e}", file=sys.stderr)
+        if check:
+            raise e
+
+
 def run_gh_command(repo_path, *args, silent=False):
     """Run a GitHub CLI command in the specified repository."""
     try:
@@ -78,6 +264,79 @@ def run_glab_command(repo_path, *args, silent=False):
         return None
 
 
+def get_github_token(repo_path):
+    """Get a GitHub API token from GH_TOKEN/GITHUB_TOKEN or the GitHub CLI.
+
+    Returns:
+        str: The token, or None if none is available
+    """
+    token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+    if token:
+        return token
+
+    # Older GitHub CLI versions don't have `gh auth token`; that just means
+    # there is no token and callers fall back to `gh api`
+    return run_gh_command(repo_path, "auth", "token", silent=True) or None
+
+
+def run_github_graphql(token, query, variables):
+    """Run a query against the GitHub GraphQL API.
+
+    Returns:
+        dict: The response's "data" object, or None if the request failed
+    """
+    request = urllib.request.Request(
+        GITHUB_GRAPHQL_URL,
+        data=json.dumps({"query": query, "variables": variables}).encode("utf-8"),
+        headers={
+            "Authorization": f"bearer {token}",
+            "Content-Type": "application/json",
+        },
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=60) as response:
+            payload = json_loads(response.read())
+    except (OSError, ValueError):
+        # Network errors, HTTP errors (auth, rate limits) and invalid JSON
+        return None
+
+    if payload.get("errors") or not payload.get("data"):
+        return None
+
+    return payload["data"]
+
+
+def run_gh_graphql(repo_path, query, variables):
+    """Run a query against the GitHub GraphQL API through `gh api graphql`.
+
+    Used when no token is available to call the API directly; the GitHub
+    CLI then authenticates the request itself. Variables set to None are
+    left out, so they take GraphQL's default of null.
+
+    Returns:
+        dict: The response's "data" object, or None if the request failed
+    """
+    args = ["api", "graphql", "-f", f"query={query}"]
+    for name, value in variables.items():
+        if value is not None:
+            args += ["-f", f"{name}={value}"]
+
+    output = run_gh_command(repo_path, *args, silent=True)
+    if not output:
+        return None
+
+    try:
+        payload = json_loads(output)
+    except json.JSONDecodeError:
+        return None
+
+    if payload.get("errors") or not payload.get("data"):
+        return None
+
+    return payload["data"]
+
+
+@lru_cache(maxsize=32)
 def get_repo_platform(repo_path):
     """Determine the hosting platform of the repository.
 
@@ -104,497 +363,837 @@ def is_github_repo(repo_path):
     return get_repo_platform(repo_path) == "github"
 
 
+@lru_cache(maxsize=32)
 def get_repo_url(repo_path):
-    """Get the repository URL from git remote (supports GitHub and GitLab)."""
-    try:
-        # Get the remote URL
-        remote_url = run_git_command(repo_path, "config", "--get", "remote.origin.url")
-        if not remote_url:
-            return None
-
-        # Handle GitHub URLs
-        # SSH format: git@github.com:owner/repo.git
-        # HTTPS format: https://github.com/owner/repo.git or https://github.com/owner/repo
-        if "github.com" in remote_url:
-            if remote_url.startswith("git@github.com:"):
-                # Convert git@github.com:owner/repo.git to https://github.com/owner/repo
-                repo_part = remote_url.replace("git@github.com:", "")
-                if repo_part.endswith(".git"):
-                    repo_part = repo_part[:-4]  # Remove .git suffix
-                return f"https://github.com/{repo_part}"
-            else:
-                # Already HTTPS, just remove .git if present
-                if remote_url.endswith(".git"):
-                    return remote_url[:-4]  # Remove .git suffix
-                return remote_url
-
-        # Handle GitLab URLs
-        # SSH format: git@gitlab.com:owner/repo.git
-        # HTTPS format: https://gitlab.com/owner/repo.git or https://gitlab.com/owner/repo
-        elif "gitlab.com" in remote_url:
-            if remote_url.startswith("git@gitlab.com:"):
-                # Convert git@gitlab.com:owner/repo.git to https://gitlab.com/owner/repo
-                repo_part = remote_url.replace("git@gitlab.com:", "")
-                if repo_part.endswith(".git"):
-                    repo_part = repo_part[:-4]  # Remove .git suffix
-                return f"https://gitlab.com/{repo_part}"
-            else:
-                # Already HTTPS, just remove .git if present
-                if remote_url.endswith(".git"):
-                    return remote_url[:-4]  # Remove .git suffix
-                return remote_url
-
-        # Handle self-hosted GitLab instances (git@gitlab.example.com:)
-        elif remote_url.startswith("git@") and ":" in remote_url:
-            # Extract host and repo part
-            # Format: git@gitlab.example.com:owner/repo.git
-            at_index = remote_url.index("@")
-            colon_index = remote_url.index(":", at_index)
-            host = remote_url[at_index + 1 : colon_index]
-            repo_part = remote_url[colon_index + 1 :]
-            if repo_part.endswith(".git"):
-                repo_part = repo_part[:-4]
-            return f"https://{host}/{repo_part}"
-
-        # Handle HTTPS URLs for self-hosted instances
-        elif remote_url.startswith("https://") or remote_url.startswith("http://"):
-            if remote_url.endswith(".git"):
-                return remote_url[:-4]
-            return remote_url
+    """Get the repository URL from git remote (supports GitHub and GitLab).
 
+    SSH remotes (git@host:owner/repo.git or ssh://git@host/owner/repo.git)
+    are converted to the host's HTTPS URL. Credentials embedded in HTTP(S)
+    remotes are dropped so they never end up in a report.
+    """
+    # Get the remote URL
+    remote_url = run_git_command(repo_path, "config", "--get", "remote.origin.url")
+    if not remote_url:
         return None
-    except Exception:
+
+    match = _REMOTE_URL_RE.match(remote_url)
+    if not match:
         return None
 
+    scheme = match.group("scheme") or "https"
+    host = match.group("web_host") or match.group("ssh_host") or match.group("scp_host")
+    return f"{scheme}://{host}/{match.group('path')}"
+
 
 def get_github_repo_url(repo_path):
     """Get the GitHub repository URL from git remote (deprecated - use get_repo_url)."""
     return get_repo_url(repo_path)
 
 
+def get_github_repo_slug(repo_path):
+    """Get the "owner/repo" slug of a GitHub repository, or None if not on GitHub."""
+    repo_url = get_repo_url(repo_path)
+    if not repo_url or "github.com/" not in repo_url:
+        return None
+
+    return repo_url.split("github.com/", 1)[1].rstrip("/")
+
+
 def get_commit_counts(repo_path, since):
     """Get commit counts per author for the specified time period."""
-    output = run_git_command(repo_path, "shortlog", "-sne", f"--since={since}")
+    # HEAD is passed explicitly: without a revision, shortlog reads a log from
+    # stdin whenever stdin is not a terminal (e.g. under cron or in a pipe)
+    output = run_git_command(repo_path, "shortlog", "-sne", f"--since={since}", "HEAD")
     if not output:
         return []
 
     counts = []
     for line in output.split("\n"):
-        if line.strip():
-            parts = line.strip().split("\t", 1)
-            count = int(parts[0].strip())
-            author_email = parts[1].strip() if len(parts) > 1 else "Unknown"
-            counts.append((count, author_email))
+        line = line.strip()
+        if not line:
+            continue
+
+        parts = line.split("\t", 1)
+        count = int(parts[0])
+        author_email = parts[1].strip() if len(parts) > 1 else "Unknown"
+        counts.append((count, author_email))
 
     return counts
 
 
-def get_detailed_commits(repo_path, since):
-    """Get detailed commit information grouped by author."""
-    # Get commit hashes and basic info
-    log_output = run_git_command(
-        repo_path, "log", f"--since={since}", "--pretty=format:%H|%an|%ae|%ar|%s"
+def _scan_history(
+    repo_path,
+    since,
+    include_merges=False,
+    include_diffs=True,
+    max_diff_bytes=DEFAULT_MAX_DIFF_BYTES,
+):
+    """Read the commits, file changes and diffs since the given time in one git pass.
+
+    Returns the history as it was read, newest first and with each commit's
+    committer date, so that _history_in_period can select any later period
+    from it. It only holds plain tuples and lists (no classes of this
+    module), so it pickles the same whether the script runs as __main__ or
+    in a worker process:
+
+    - "commits": (committer time, author, mailmapped author, hash, subject,
+      author time) per commit
+    - "changes": (committer time, change letter, path) per file change
+    - "diffs": (committer time, short hash, commit info, author time, path,
+      patch digest, lines, size, truncated) per "diff --git" section, or
+      None without include_diffs. At most max_diff_bytes of each section's
+      lines are kept; size counts all of them.
+    - "complete": false when git failed, so the history may be partial
+    """
+    # Every commit's header is prefixed with a NUL byte and its fields are
+    # separated by the ASCII unit separator, which can't collide with names or
+    # subjects. It is followed by --raw status lines (":<modes> <oids> <status>
+    # <TAB>path") and, with -p, the patch split into per-file sections on the
+    # "diff --git" headers.
+    merge_args = ["--diff-merges=first-parent"] if include_merges else []
+    log_lines = run_git_stream(
+        repo_path,
+        "log",
+        f"--since={since}",
+        "--raw",
+        *(["-p"] if include_diffs else []),
+        "-M",
+        "-C",
+        *merge_args,
+        "--pretty=format:%x00%H%x1f%h%x1f%P%x1f%an%x1f%ae%x1f%aN%x1f%aE%x1f%at"
+        "%x1f%ct%x1f%s",
+        check=True,
     )
 
-    if not log_output:
-        return {}
+    commits = []
+    changes = []
+    diffs = [] if include_diffs else None
+
+    # Bytes of diff kept for each section (with max_diff_bytes); the file's
+    # budget across sections is applied when a period is selected
+    limit = max_diff_bytes or None
+
+    # The "diff --git" section being read. Its extended header is held until
+    # the path is known; after that only the lines that fit in the limit are
+    # kept, while every line is counted and digested (SHA-1) so truncation
+    # notes and duplicates stay exact. Like git patch-id, the digest leaves
+    # out what depends on the rest of the file (blob ids, similarity and hunk
+    # headers), so a change applied to a different version of the file is
+    # still recognized.
+    section = None
+
+    def add_line(line, digested=True):
+        # Trailing blank lines aren't part of the diff text, so they are only
+        # added once a later line follows them
+        if not line:
+            section["blank_lines"] += 1
+            return
+
+        data = line.encode("utf-8")
+        blank_lines = section["blank_lines"]
+        if blank_lines:
+            section["blank_lines"] = 0
+            data = b"\n" * blank_lines + data
+            line = "\n" * blank_lines + line
+
+        size = len(data) + 1
+        section["size"] += size
+        if line.startswith("@@"):
+            # Only where a hunk starts, not its line numbers or context
+            section["digest"].update(b"@@\n")
+        elif digested:
+            section["digest"].update(data + b"\n")
+
+        # A line fits if it does without its newline, as the last line of an
+        # untruncated diff has none
+        if section["truncated"]:
+            return
+        if limit is None or section["kept_size"] + size <= limit + 1:
+            section["lines"].append(line)
+            section["kept_size"] += size
+        else:
+            section["truncated"] = True
+
+    def end_header():
+        header = section.pop("header")
+        section["path"] = _diff_section_path(header)
+        for line in header:
+            add_line(line, not line.startswith(_DIFF_HEADER_UNDIGESTED))
+
+    def finish_section():
+        if "header" in section:
+            end_header()
+
+        diffs.append(
+            (
+                section["commit_time"],
+                section["hash"],
+                section["commit"],
+                section["time"],
+                section["path"],
+                section["digest"].digest(),
+                section["lines"],
+                section["size"],
+                section["truncated"],
+            )
+        )
 
-    commits_by_author = defaultdict(list)
+    skip_changes = True
+    short_hash = commit_info = author_time = commit_time = None
 
-    for line in log_output.split("\n"):
-        if not line.strip():
-            continue
+    complete = True
+    try:
+        for line in log_lines:
+            if line.startswith("\x00"):
+                if section is not None:
+                    finish_section()
+                    section = None
+
+                parts = line[1:].split("\x1f", 9)
+                if len(parts) < 10:
+                    skip_changes = True
+                    continue
+
+                (
+                    commit_hash,
+                    short_hash,
+                    parents,
+                    author_name,
+                    author_email,
+                    mailmap_name,
+                    mailmap_email,
+                    author_time,
+                    commit_time,
+                    subject,
+                ) = parts
+
+                # Merge commits only contribute diffs (with include_merges); their
+                # changes are not counted as file changes of their own
+                skip_changes = " " in parents
+                commit_info = f"{short_hash} - {subject}"
+                author_time = int(author_time) if author_time.isdigit() else 0
+                commit_time = int(commit_time) if commit_time.isdigit() else 0
+
+                commits.append(
+                    (
+                        commit_time,
+                        f"{author_name} <{author_email}>",
+                        f"{mailmap_name} <{mailmap_email}>",
+                        commit_hash[:7],
+                        subject,
+                        author_time,
+                    )
+                )
+            elif line.startswith("diff --git "):
+                if section is not None:
+                    finish_section()
+
+                section = {
+                    "commit_time": commit_time,
+                    "hash": short_hash,
+                    "commit": commit_info,
+                    "time": author_time,
+                    "header": [line],
+                    "path": None,
+                    "lines": [],
+                    "kept_size": 0,
+                    "size": 0,
+                    "blank_lines": 0,
+                    "truncated": False,
+                    "digest": hashlib.sha1(),
+                }
+            elif section is not None:
+                if "header" not in section:
+                    add_line(line)
+                elif line.startswith(("@@", "---", "Binary files")):
+                    end_header()
+                    add_line(line)
+                else:
+                    section["header"].append(line)
+            elif skip_changes or not line.startswith(":"):
+                continue
+            else:
+                # A rename counts as deleting the old path and adding the new
+                # one, and a copy as adding the new path
+                parts = line.split("\t")
+                if len(parts) < 2:
+                    continue
+
+                letter = parts[0].rsplit(" ", 1)[-1][:1]
+                if letter == "R" and len(parts) > 2:
+                    changes.append((commit_time, "D", parts[1]))
+                    changes.append((commit_time, "A", parts[2]))
+                elif letter == "C" and len(parts) > 2:
+                    changes.append((commit_time, "A", parts[2]))
+                else:
+                    changes.append((commit_time, letter, parts[1]))
+    except subprocess.CalledProcessError:
+        # git failed; what it printed is still reported, but not as complete
+        complete = False
 
-        parts = line.split("|", 4)
-        if len(parts) < 5:
-            continue
+    if section is not None:
+        finish_section()
 
-        commit_hash, author_name, author_email, relative_date, subject = parts
-        author_key = f"{author_name} <{author_email}>"
+    return {
+        "commits": commits,
+        "changes": changes,
+        "diffs": diffs,
+        "complete": complete,
+    }
 
-        # Get files changed in this commit
-        stat_output = run_git_command(
-            repo_path, "show", "--stat", "--format=", commit_hash
-        )
 
-        files_changed = []
-        if stat_output:
-            for stat_line in stat_output.split("\n"):
-                if stat_line.strip() and "|" in stat_line:
-                    # Parse file change stats
-                    file_info = stat_line.strip()
-                    files_changed.append(file_info)
-
-        # Get the diff for this commit
-        diff_output = run_git_command(
-            repo_path, "show", "--format=", "--stat", commit_hash
-        )
+def _fit_diff(lines, size, truncated, limit):
+    """Cut a scanned diff section to limit bytes on a line boundary.
 
-        commits_by_author[author_key].append(
-            {
-                "hash": commit_hash[:7],
-                "subject": subject,
-                "date": relative_date,
-                "files": files_changed,
-                "diff_summary": diff_output,
-            }
-        )
+    Returns the diff text and the bytes of the file's budget left after it
+    (None without a limit). Anything cut off is replaced by a note saying
+    how many bytes were left out.
+    """
+    if limit is None:
+        return "\n".join(lines), None
+
+    kept = len(lines)
+    kept_size = size
+    if truncated or size > limit + 1:
+        # A line fits if it does without its newline, as the last line of an
+        # untruncated diff has none
+        kept_size = 0
+        for kept, line in enumerate(lines):
+            line_size = len(line.encode("utf-8")) + 1
+            if kept_size + line_size > limit + 1:
+                truncated = True
+                break
+            kept_size += line_size
+        else:
+            kept = len(lines)
 
-    return commits_by_author
+    if not truncated:
+        return "\n".join(lines), max(limit - kept_size, 0)
 
+    if kept_size > limit:
+        kept -= 1
+        kept_size -= len(lines[kept].encode("utf-8")) + 1
+    # Note how much was dropped after the whole lines that fit
+    dropped = size - 1 - kept_size
+    diff = "".join(f"{line}\n" for line in lines[:kept])
+    return f"{diff}… (truncated, {dropped} more bytes)", 0
 
-def get_file_change_stats(repo_path, since):
-    """Get counts of unique files added, modified, and deleted in the specified time period."""
-    # Get all commits from the specified time period
-    log_output = run_git_command(
-        repo_path, "log", f"--since={since}", "--pretty=format:%H"
-    )
 
-    if not log_output:
-        return {"added": 0, "modified": 0, "deleted": 0}
+def _history_in_period(history, start, max_diff_bytes=DEFAULT_MAX_DIFF_BYTES):
+    """Select the commit report data for the period starting at start.
+
+    history comes from _scan_history and start is a Unix timestamp (None
+    keeps everything). Like git log --since, commits are selected by their
+    committer date. Returns a dict with the commit counts, the commits
+    grouped by author, the file change statistics and the file diffs (None
+    if the history has no diffs); see get_commit_counts,
+    get_detailed_commits, get_file_change_stats and get_file_diffs.
+    """
+    if start is None:
+        start = 0
 
-    commit_hashes = log_output.split("\n")
+    author_counts = Counter()
+    commits_by_author = defaultdict(list)
+    for (
+        commit_time,
+        author,
+        mailmap_author,
+        commit_hash,
+        subject,
+        author_time,
+    ) in history["commits"]:
+        if commit_time >= start:
+            author_counts[mailmap_author] += 1
+            commits_by_author[author].append(
+                CommitRecord(commit_hash, subject, author_time)
+            )
 
-    # Track unique files and their most recent status
-    # We'll use sets to track files that were added or deleted
-    # and track the first status we see for each file
-    added_files = set()
-    deleted_files = set()
-    modified_files = set()
+    # Most commits first and then by name, as git shortlog -n orders them
+    commit_counts = [
+        (count, author)
+        for author, count in sorted(
+            author_counts.items(), key=lambda item: (-item[1], item[0])
+        )
+    ]
 
-    for commit_hash in commit_hashes:
-        if not commit_hash.strip():
+    # Track the net status ("A", "M" or "D") of every file seen in the period,
+    # replaying the changes oldest first
+    file_status = {}
+    for commit_time, letter, file_path in reversed(history["changes"]):
+        if commit_time < start:
             continue
+        current = file_status.get(file_path)
+        new = _FILE_STATUS_TRANSITIONS.get((current, letter), current)
+        if new is None:
+            file_status.pop(file_path, None)
+        else:
+            file_status[file_path] = new
 
-        # Get the status of files changed in this commit
-        diff_output = run_git_command(
-            repo_path, "diff-tree", "--no-commit-id", "--name-status", "-r", commit_hash
-        )
+    counts = Counter(file_status.values())
+    file_stats = {
+        "added": counts["A"],
+        "modified": counts["M"],
+        "deleted": counts["D"],
+    }
 
-        if not diff_output:
+    data = {
+        "commit_counts": commit_counts,
+        "commits_by_author": commits_by_author,
+        "file_stats": file_stats,
+        "file_diffs": None,
+        "complete": history["complete"],
+    }
+    if history["diffs"] is None:
+        return data
+
+    # Track files and their diffs across all commits, and the diff entries
+    # with the same (file, patch digest), newest first
+    file_diffs = defaultdict(list)
+    same_diffs = defaultdict(list)
+
+    # Bytes of diff each file may still show (with max_diff_bytes)
+    remaining_bytes = {}
+
+    for (
+        commit_time,
+        short_hash,
+        commit_info,
+        author_time,
+        file_path,
+        digest,
+        lines,
+        size,
+        truncated,
+    ) in history["diffs"]:
+        if commit_time < start:
             continue
 
-        for line in diff_output.split("\n"):
-            if not line.strip():
-                continue
+        entry = {"commit": commit_info, "time": author_time, "diff": None}
+        group = same_diffs[file_path, digest]
 
-            parts = line.split("\t")
-            if len(parts) < 2:
-                continue
+        # A repeated diff is shown as a reference, so it doesn't use up the
+        # file's budget again
+        if not group:
+            limit = None
+            if max_diff_bytes:
+                limit = remaining_bytes.get(file_path, max_diff_bytes)
+            entry["diff"], remaining = _fit_diff(lines, size, truncated, limit)
+            if remaining is not None:
+                remaining_bytes[file_path] = remaining
 
-            status = parts[0]
-            file_path = parts[1]
-
-            # Track additions - a file was created in this period
-            if status.startswith("A"):
-                # If we haven't seen this file as deleted, mark it as added
-                if file_path not in deleted_files:
-                    added_files.add(file_path)
-                    # Remove from modified if it was there (new file takes precedence)
-                    modified_files.discard(file_path)
-
-            # Track deletions
-            elif status.startswith("D"):
-                # If this file was added in this period, remove it from added
-                # (file was added then deleted = net zero)
-                if file_path in added_files:
-                    added_files.discard(file_path)
-                else:
-                    deleted_files.add(file_path)
-                # Remove from modified since it's now deleted
-                modified_files.discard(file_path)
+        group.append((short_hash, entry))
+        file_diffs[file_path].append(entry)
 
-            # Track modifications - only if not already tracked as added or deleted
-            elif status.startswith("M"):
-                if file_path not in added_files and file_path not in deleted_files:
-                    modified_files.add(file_path)
+    # Show each repeated change with the oldest commit that made it (the
+    # newest copy is the one cut to the budget above); the others, reached
+    # through a cherry-pick, rebase or merge, refer back to it
+    for group in same_diffs.values():
+        if len(group) > 1:
+            first_hash, first_entry = group[-1]
+            first_entry["diff"] = group[0][1]["diff"]
+            for _, entry in group[:-1]:
+                entry["diff"] = f"(same as {first_hash})"
 
-    return {
-        "added": len(added_files),
-        "modified": len(modified_files),
-        "deleted": len(deleted_files),
-    }
+    data["file_diffs"] = file_diffs
+    return data
 
 
-def calculate_since_date(since):
-    """Convert git time range format to ISO date."""
-    from datetime import timedelta
+def get_detailed_commits(repo_path, since):
+    """Get detailed commit information grouped by author."""
+    history = _scan_history(repo_path, since, include_diffs=False)
+    return _history_in_period(history, None)["commits_by_author"]
+
 
-    # Parse the time range format (e.g., "1.week", "2.months")
+def get_file_change_stats(repo_path, since):
+    """Get counts of unique files added, modified, and deleted in the specified time period."""
+    history = _scan_history(repo_path, since, include_diffs=False)
+    return _history_in_period(history, None)["file_stats"]
+
+
+@lru_cache(maxsize=32)
+def _since_days(since):
+    """Return the number of days in a time range such as "1.week" or "2.months".
+
+    Ranges with an unknown unit count as one week; None is returned when the
+    range isn't in "<number>.<unit>" form at all.
+    """
     parts = since.split(".")
     if len(parts) != 2:
-        # If not in expected format, default to 7 days ago
-        return (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
+        return None
 
     try:
         num = int(parts[0])
-        unit = parts[1].lower()
-
-        # Calculate days based on unit
-        if unit in ["week", "weeks"]:
-            days = num * 7
-        elif unit in ["month", "months"]:
-            days = num * 30
-        elif unit in ["year", "years"]:
-            days = num * 365
-        elif unit in ["day", "days"]:
-            days = num
-        else:
-            days = 7  # Default to 1 week
+    except ValueError:
+        return None
 
-        # Calculate the date
-        target_date = datetime.now() - timedelta(days=days)
-        return target_date.strftime("%Y-%m-%d")
-    except (ValueError, IndexError):
-        # If parsing fails, default to 7 days ago
-        return (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
+    unit_days = _UNIT_DAYS.get(parts[1].lower())
+    if not unit_days:
+        return 7  # Default to 1 week
 
+    return num * unit_days
 
-def get_github_issues_stats(repo_path, since):
-    """Get statistics about GitHub issues for the specified time period."""
-    # Convert since format to ISO date
-    since_date = calculate_since_date(since)
 
-    stats = {"created": [], "updated": [], "closed": []}
+@lru_cache(maxsize=32)
+def calculate_since_date(since):
+    """Convert git time range format to ISO date."""
+    days = _since_days(since)
+    if days is None:
+        days = 7  # Default to 1 week if the format isn't recognized
 
-    # Get issues created in the period
-    created_output = run_gh_command(
-        repo_path,
-        "issue",
-        "list",
-        "--search",
-        f"created:>={since_date}",
-        "--json",
-        "number,title,author,createdAt,state",
-        "--limit",
-        "1000",
-        silent=True,
-    )
+    # Calculate the date by counting back whole days from today; isoformat()
+    # gives YYYY-MM-DD without going through strftime
+    return date.fromordinal(date.today().toordinal() - days).isoformat()
 
-    if created_output:
-        try:
-            stats["created"] = json.loads(created_output)
-        except json.JSONDecodeError:
-            pass
 
-    # Get issues updated in the period
-    updated_output = run_gh_command(
-        repo_path,
-        "issue",
-        "list",
-        "--search",
-        f"updated:>={since_date}",
-        "--json",
-        "number,title,author,updatedAt,state",
-        "--limit",
-        "1000",
-        silent=True,
-    )
+def _plural(count, unit):
+    """Return e.g. "1 day" or "3 days"."""
+    return f"{count} {unit}" if count == 1 else f"{count} {unit}s"
 
-    if updated_output:
-        try:
-            stats["updated"] = json.loads(updated_output)
-        except json.JSONDecodeError:
-            pass
 
-    # Get issues closed in the period
-    closed_output = run_gh_command(
-        repo_path,
-        "issue",
-        "list",
-        "--search",
-        f"closed:>={since_date}",
-        "--state",
-        "closed",
-        "--json",
-        "number,title,author,closedAt,state",
-        "--limit",
-        "1000",
-        silent=True,
-    )
+def format_relative_date(timestamp, now):
+    """Describe a Unix timestamp relative to now the way git's %ar does.
 
-    if closed_output:
-        try:
-            stats["closed"] = json.loads(closed_output)
-        except json.JSONDecodeError:
-            pass
+    Commit dates are stored as timestamps and described when a report is
+    rendered, so cached report data never shows stale ages.
+    """
+    if timestamp > now:
+        return "in the future"
+
+    # The same roundings and cut-offs as git's show_date_relative()
+    diff = now - timestamp
+    if diff < 90:
+        return f"{_plural(diff, 'second')} ago"
+    diff = (diff + 30) // 60
+    if diff < 90:
+        return f"{_plural(diff, 'minute')} ago"
+    diff = (diff + 30) // 60
+    if diff < 36:
+        return f"{_plural(diff, 'hour')} ago"
+    diff = (diff + 12) // 24
+    if diff < 14:
+        return f"{_plural(diff, 'day')} ago"
+    if diff < 70:
+        return f"{_plural((diff + 3) // 7, 'week')} ago"
+    if diff < 365:
+        return f"{_plural((diff + 15) // 30, 'month')} ago"
+    if diff < 1825:
+        total_months = (diff * 12 * 2 + 365) // (365 * 2)
+        years, months = divmod(total_months, 12)
+        if months:
+            return f"{_plural(years, 'year')}, {_plural(months, 'month')} ago"
+        return f"{_plural(years, 'year')} ago"
+    return f"{_plural((diff + 183) // 365, 'year')} ago"
+
+
+def _period_start(repo_path, since):
+    """Return the start of a time range as a Unix timestamp, or None if unknown.
+
+    git resolves the range itself (git rev-parse --since=...), so it is the
+    window git log would use.
+    """
+    output = run_git_command(repo_path, "rev-parse", f"--since={since}")
+    if not output or not output.startswith("--max-age="):
+        return None
 
-    return stats
+    try:
+        return int(output[len("--max-age=") :])
+    except ValueError:
+        return None
 
 
-def get_github_pr_stats(repo_path, since):
-    """Get statistics about GitHub pull requests for the specified time period."""
-    # Convert since format to ISO date
-    since_date = calculate_since_date(since)
+def _github_searches(repo_slug, since_date):
+    """Return the (key, search query) pairs used for GitHub summary statistics.
 
-    stats = {"created": [], "updated": [], "merged": [], "closed": []}
+    Issues and PRs counted as created are the ones still open, as with the
+    GitLab summary.
+    """
+    repo = f"repo:{repo_slug}"
+    return [
+        (("issue", "created"), f"{repo} is:issue is:open created:>={since_date}"),
+        (("issue", "closed"), f"{repo} is:issue is:closed closed:>={since_date}"),
+        (("pr", "created"), f"{repo} is:pr is:open created:>={since_date}"),
+        (("pr", "merged"), f"{repo} is:pr is:merged merged:>={since_date}"),
+        (
+            ("pr", "closed"),
+            f"{repo} is:pr is:closed is:unmerged closed:>={since_date}",
+        ),
+    ]
+
+
+def search_github_graphql(run_query, searches):
+    """Run several GitHub searches in a single GraphQL request per page.
+
+    Every search is an aliased `search` field of the same query, so all of
+    them are answered by one round-trip. Searches with more results are
+    paged through together until GITHUB_SEARCH_LIMIT is reached.
+
+    Args:
+        run_query: Callable taking (query, variables) and returning the
+            response data or None, e.g. run_github_graphql bound to a token
+        searches: List of (key, search query) pairs
 
-    # Get PRs created in the period
-    created_output = run_gh_command(
-        repo_path,
-        "pr",
-        "list",
-        "--search",
-        f"created:>={since_date}",
-        "--json",
-        "number,title,author,createdAt,state",
-        "--limit",
-        "1000",
-        silent=True,
-    )
+    Returns:
+        dict: Search key -> list of {number, title, state, author} records,
+        or None if the API request failed
+    """
+    results = {key: [] for key, _ in searches}
+    cursors = {key: None for key, _ in searches}
+    pending = list(searches)
+
+    while pending:
+        parameters = []
+        fields = []
+        variables = {}
+        for i, (key, search) in enumerate(pending):
+            parameters.append(f"$query{i}: String!, $after{i}: String")
+            fields.append(
+                f"search{i}: search(query: $query{i}, type: ISSUE, first: 100, "
+                f"after: $after{i}) {{ pageInfo {{ hasNextPage endCursor }} "
+                "nodes { ... on Issue { number title state author { login } } "
+                "... on PullRequest { number title state author { login } } } }"
+            )
+            variables[f"query{i}"] = search
+            variables[f"after{i}"] = cursors[key]
 
-    if created_output:
-        try:
-            stats["created"] = json.loads(created_output)
-        except json.JSONDecodeError:
-            pass
+        query = f"query({', '.join(parameters)}) {{ {' '.join(fields)} }}"
+        data = run_query(query, variables)
+        if data is None:
+            return None
 
-    # Get PRs updated in the period
-    updated_output = run_gh_command(
-        repo_path,
-        "pr",
-        "list",
-        "--search",
-        f"updated:>={since_date}",
-        "--json",
-        "number,title,author,updatedAt,state",
-        "--limit",
-        "1000",
-        silent=True,
-    )
+        next_pending = []
+        for i, (key, search) in enumerate(pending):
+            result = data[f"search{i}"]
+            results[key].extend(node for node in result["nodes"] if node)
 
-    if updated_output:
-        try:
-            stats["updated"] = json.loads(updated_output)
-        except json.JSONDecodeError:
-            pass
+            page_info = result["pageInfo"]
+            if page_info["hasNextPage"] and len(results[key]) < GITHUB_SEARCH_LIMIT:
+                cursors[key] = page_info["endCursor"]
+                next_pending.append((key, search))
 
-    # Get PRs merged in the period
-    merged_output = run_gh_command(
-        repo_path,
-        "pr",
-        "list",
-        "--search",
-        f"merged:>={since_date}",
-        "--state",
-        "merged",
-        "--json",
-        "number,title,author,mergedAt",
-        "--limit",
-        "1000",
-        silent=True,
-    )
+        pending = next_pending
 
-    if merged_output:
-        try:
-            stats["merged"] = json.loads(merged_output)
-        except json.JSONDecodeError:
-            pass
+    return results
 
-    # Get PRs closed (but not merged) in the period
-    closed_output = run_gh_command(
-        repo_path,
-        "pr",
-        "list",
-        "--search",
-        f"closed:>={since_date} is:unmerged",
-        "--state",
-        "closed",
-        "--json",
-        "number,title,author,closedAt",
-        "--limit",
-        "1000",
-        silent=True,
+
+def run_cli_queries(run_command, repo_path, queries, **kwargs):
+    """Run independent CLI queries concurrently and return their output.
+
+    The queries are network-bound and share no data, so they are issued in
+    parallel rather than one after another. The GitLab summary uses this;
+    GitHub statistics come from one batched GraphQL search instead.
+
+    Args:
+        run_command: Runner for the CLI (e.g. run_glab_command)
+        repo_path: Path to the repository the queries run in
+        queries: List of (key, CLI arguments) pairs
+        **kwargs: Extra keyword arguments passed to run_command
+
+    Returns:
+        dict: Query key -> command output (None if the query failed)
+    """
+    with ThreadPoolExecutor(
+        max_workers=min(CLI_QUERY_WORKERS, len(queries))
+    ) as executor:
+        futures = [
+            (
+                key,
+                executor.submit(run_command, repo_path, *args, silent=True, **kwargs),
+            )
+            for key, args in queries
+        ]
+
+    return {key: future.result() for key, future in futures}
+
+
+def _merge_by_number(*item_lists):
+    """Concatenate issue or PR lists, keeping the first entry for each number."""
+    merged = {}
+    for items in item_lists:
+        for item in items:
+            merged.setdefault(item.get("number"), item)
+    return list(merged.values())
+
+
+def _add_github_updated(issue_stats, pr_stats):
+    """Derive the "updated" lists from the issues and PRs found by the other searches.
+
+    Like the GitLab summary, everything created, closed or merged in the
+    period counts as updated, which saves a search per kind.
+    """
+    issue_stats["updated"] = _merge_by_number(
+        issue_stats["created"], issue_stats["closed"]
+    )
+    pr_stats["updated"] = _merge_by_number(
+        pr_stats["created"], pr_stats["merged"], pr_stats["closed"]
     )
 
-    if closed_output:
-        try:
-            stats["closed"] = json.loads(closed_output)
-        except json.JSONDecodeError:
-            pass
 
-    return stats
+def get_github_issues_stats(repo_path, since):
+    """Get statistics about GitHub issues for the specified time period."""
+    stats = get_github_stats(repo_path, since)
+    if stats is None:
+        return {"created": [], "updated": [], "closed": []}
+    return stats[0]
+
+
+def get_github_pr_stats(repo_path, since):
+    """Get statistics about GitHub pull requests for the specified time period."""
+    stats = get_github_stats(repo_path, since)
+    if stats is None:
+        return {"created": [], "updated": [], "merged": [], "closed": []}
+    return stats[1]
+
+
+def get_github_stats(repo_path, since):
+    """Get GitHub issue and pull request statistics with all searches run at once.
+
+    All searches go out as one GraphQL request (per page of results): sent
+    directly when an API token is available, and through `gh api graphql`
+    otherwise.
+
+    Returns:
+        tuple: (issue_stats, pr_stats), or None if the searches failed (e.g.
+        gh is missing, not logged in or rate limited)
+    """
+    # Convert since format to ISO date
+    since_date = calculate_since_date(since)
+
+    repo_slug = get_github_repo_slug(repo_path)
+    searches = _github_searches(repo_slug, since_date)
+
+    results = None
+    token = get_github_token(repo_path) if repo_slug else None
+    if token:
+        results = search_github_graphql(partial(run_github_graphql, token), searches)
+    if results is None and repo_slug:
+        results = search_github_graphql(partial(run_gh_graphql, repo_path), searches)
+    if results is None:
+        return None
+
+    issue_stats = {}
+    pr_stats = {}
+    for (kind, key), items in results.items():
+        (issue_stats if kind == "issue" else pr_stats)[key] = items
+    _add_github_updated(issue_stats, pr_stats)
+
+    return issue_stats, pr_stats
 
 
 def parse_relative_time(time_str, since):
     """Check if a relative time string is within the since period."""
     # Parse the time string like "about 18 hours ago", "about 1 day ago", "3 weeks ago"
-    time_str = time_str.lower().strip()
-
-    # Extract number and unit
-    import re
-
-    match = re.search(r"(\d+)\s*(hour|day|week|month|year)", time_str)
+    match = _RELATIVE_TIME_RE.search(time_str.lower())
     if not match:
         # If we can't parse it, assume it's recent
         return True
 
-    value = int(match.group(1))
-    unit = match.group(2)
-
-    # Convert to days
-    if unit == "hour":
-        days = value / 24.0
-    elif unit == "day":
-        days = value
-    elif unit == "week":
-        days = value * 7
-    elif unit == "month":
-        days = value * 30
-    elif unit == "year":
-        days = value * 365
-    else:
-        return True
+    days = int(match.group(1)) * _RELATIVE_UNIT_DAYS[match.group(2)]
 
     # Parse the since parameter (e.g., "1.week", "2.months")
-    since_parts = since.split(".")
-    if len(since_parts) != 2:
+    since_days = _since_days(since)
+    if since_days is None:
         return True
 
-    try:
-        since_num = int(since_parts[0])
-        since_unit = since_parts[1].lower()
-
-        # Convert since to days
-        if since_unit in ["week", "weeks"]:
-            since_days = since_num * 7
-        elif since_unit in ["month", "months"]:
-            since_days = since_num * 30
-        elif since_unit in ["year", "years"]:
-            since_days = since_num * 365
-        elif since_unit in ["day", "days"]:
-            since_days = since_num
-        else:
-            since_days = 7  # Default to 1 week
-
-        # Check if the item is within the time range
-        return days <= since_days
-    except (ValueError, IndexError):
-        return True
-
-
-def get_gitlab_issues_stats(repo_path, since):
-    """Get statistics about GitLab issues for the specified time period."""
+    # Check if the item is within the time range
+    return days <= since_days
+
+
+def _gitlab_issue_queries():
+    """Return the (key, glab arguments) pairs used to collect GitLab issue statistics."""
+    return [
+        # Get all open issues (for created), sorted by most recently created
+        (
+            "created",
+            (
+                "issue",
+                "list",
+                "--order",
+                "created_at",
+                "--sort",
+                "desc",
+                "--per-page",
+                "100",
+            ),
+        ),
+        # Get closed issues, sorted by most recently updated
+        (
+            "closed",
+            (
+                "issue",
+                "list",
+                "--state",
+                "closed",
+                "--order",
+                "updated_at",
+                "--sort",
+                "desc",
+                "--per-page",
+                "100",
+            ),
+        ),
+    ]
+
+
+def _gitlab_mr_queries():
+    """Return the (key, glab arguments) pairs used to collect GitLab MR statistics."""
+    return [
+        # Get all open MRs (for created), sorted by most recently created
+        (
+            "created",
+            (
+                "mr",
+                "list",
+                "--order",
+                "created_at",
+                "--sort",
+                "desc",
+                "--per-page",
+                "100",
+            ),
+        ),
+        # Get merged MRs, sorted by most recently merged
+        (
+            "merged",
+            (
+                "mr",
+                "list",
+                "--merged",
+                "--order",
+                "merged_at",
+                "--sort",
+                "desc",
+                "--per-page",
+                "100",
+            ),
+        ),
+        # Get closed MRs (not merged), sorted by most recently updated
+        (
+            "closed",
+            (
+                "mr",
+                "list",
+                "--closed",
+                "--order",
+                "updated_at",
+                "--sort",
+                "desc",
+                "--per-page",
+                "100",
+            ),
+        ),
+    ]
+
+
+def _parse_gitlab_issues(outputs, since):
+    """Build GitLab issue statistics from the output of the issue queries."""
     stats = {"created": [], "updated": [], "closed": []}
 
-    # Get all open issues (for created), sorted by most recently created
-    created_output = run_glab_command(
-        repo_path,
-        "issue",
-        "list",
-        "--order",
-        "created_at",
-        "--sort",
-        "desc",
-        "--per-page",
-        "100",
-        silent=True,
-    )
+    created_output = outputs["created"]
 
     if created_output:
         # Parse glab output (format: #number\ttitle\t(state)\tcreated_at)
         for line in created_output.split("\n"):
-            if line.strip() and line.startswith("#"):
+            if line.startswith("#"):
                 try:
                     # Extract issue number and other fields
                     parts = line.split("\t")
@@ -618,25 +1217,11 @@ def get_gitlab_issues_stats(repo_path, since):
                 except (ValueError, IndexError):
                     pass
 
-    # Get closed issues, sorted by most recently updated
-    closed_output = run_glab_command(
-        repo_path,
-        "issue",
-        "list",
-        "--state",
-        "closed",
-        "--order",
-        "updated_at",
-        "--sort",
-        "desc",
-        "--per-page",
-        "100",
-        silent=True,
-    )
+    closed_output = outputs["closed"]
 
     if closed_output:
         for line in closed_output.split("\n"):
-            if line.strip() and line.startswith("#"):
+            if line.startswith("#"):
                 try:
                     parts = line.split("\t")
                     if len(parts) >= 2:
@@ -665,27 +1250,15 @@ def get_gitlab_issues_stats(repo_path, since):
     return stats
 
 
-def get_gitlab_mr_stats(repo_path, since):
-    """Get statistics about GitLab merge requests for the specified time period."""
+def _parse_gitlab_mrs(outputs):
+    """Build GitLab merge request statistics from the output of the MR queries."""
     stats = {"created": [], "updated": [], "merged": [], "closed": []}
 
-    # Get all open MRs (for created), sorted by most recently created
-    created_output = run_glab_command(
-        repo_path,
-        "mr",
-        "list",
-        "--order",
-        "created_at",
-        "--sort",
-        "desc",
-        "--per-page",
-        "100",
-        silent=True,
-    )
+    created_output = outputs["created"]
 
     if created_output:
         for line in created_output.split("\n"):
-            if line.strip() and line.startswith("!"):
+            if line.startswith("!"):
                 try:
                     parts = line.split("\t")
                     if len(parts) >= 2:
@@ -701,24 +1274,11 @@ def get_gitlab_mr_stats(repo_path, since):
                 except (ValueError, IndexError):
                     pass
 
-    # Get merged MRs, sorted by most recently merged
-    merged_output = run_glab_command(
-        repo_path,
-        "mr",
-        "list",
-        "--merged",
-        "--order",
-        "merged_at",
-        "--sort",
-        "desc",
-        "--per-page",
-        "100",
-        silent=True,
-    )
+    merged_output = outputs["merged"]
 
     if merged_output:
         for line in merged_output.split("\n"):
-            if line.strip() and line.startswith("!"):
+            if line.startswith("!"):
                 try:
                     parts = line.split("\t")
                     if len(parts) >= 2:
@@ -734,36 +1294,22 @@ def get_gitlab_mr_stats(repo_path, since):
                 except (ValueError, IndexError):
                     pass
 
-    # Get closed MRs (not merged), sorted by most recently updated
-    closed_output = run_glab_command(
-        repo_path,
-        "mr",
-        "list",
-        "--closed",
-        "--order",
-        "updated_at",
-        "--sort",
-        "desc",
-        "--per-page",
-        "100",
-        silent=True,
-    )
+    closed_output = outputs["closed"]
 
     if closed_output:
+        merged_numbers = {mr["number"] for mr in stats["merged"]}
         for line in closed_output.split("\n"):
-            if line.strip() and line.startswith("!"):
+            if line.startswith("!"):
                 try:
                     parts = line.split("\t")
                     if len(parts) >= 2:
-                        number = parts[0].strip("!")
+                        number = int(parts[0].strip("!"))
                         title = parts[1].strip()
                         # Only add if not already in merged list
-                        if not any(
-                            mr["number"] == int(number) for mr in stats["merged"]
-                        ):
+                        if number not in merged_numbers:
                             stats["closed"].append(
                                 {
-                                    "number": int(number),
+                                    "number": number,
                                     "title": title,
                                     "author": {"login": "Unknown"},
                                 }
@@ -777,63 +1323,311 @@ def get_gitlab_mr_stats(repo_path, since):
     return stats
 
 
-def get_file_diffs(repo_path, since):
-    """Get all diffs for files changed in the specified time period, grouped by file."""
-    # Get all commits from the specified time period
-    log_output = run_git_command(
-        repo_path, "log", f"--since={since}", "--pretty=format:%H"
+def get_gitlab_issues_stats(repo_path, since):
+    """Get statistics about GitLab issues for the specified time period."""
+    outputs = run_cli_queries(run_glab_command, repo_path, _gitlab_issue_queries())
+    return _parse_gitlab_issues(outputs, since)
+
+
+def get_gitlab_mr_stats(repo_path, since):
+    """Get statistics about GitLab merge requests for the specified time period."""
+    outputs = run_cli_queries(run_glab_command, repo_path, _gitlab_mr_queries())
+    return _parse_gitlab_mrs(outputs)
+
+
+def get_gitlab_stats(repo_path, since):
+    """Get GitLab issue and merge request statistics for the specified time period.
+
+    All issue and MR queries are issued together in one concurrent batch.
+
+    Returns:
+        tuple: (issue_stats, mr_stats), or None if every query failed (e.g.
+        glab is missing or not logged in)
+    """
+    issue_queries = _gitlab_issue_queries()
+    mr_queries = _gitlab_mr_queries()
+
+    outputs = run_cli_queries(
+        run_glab_command,
+        repo_path,
+        [(("issue", key), args) for key, args in issue_queries]
+        + [(("mr", key), args) for key, args in mr_queries],
     )
+    if all(output is None for output in outputs.values()):
+        return None
 
-    if not log_output:
-        return {}
+    issue_outputs = {key: outputs[("issue", key)] for key, _ in issue_queries}
+    mr_outputs = {key: outputs[("mr", key)] for key, _ in mr_queries}
 
-    commit_hashes = log_output.split("\n")
+    return _parse_gitlab_issues(issue_outputs, since), _parse_gitlab_mrs(mr_outputs)
 
-    # Track files and their diffs across all commits
-    file_diffs = defaultdict(list)
 
-    for commit_hash in commit_hashes:
-        if not commit_hash.strip():
-            continue
+def get_file_diffs(
+    repo_path, since, include_merges=False, max_diff_bytes=DEFAULT_MAX_DIFF_BYTES
+):
+    """Get all diffs for files changed in the specified time period, grouped by file.
+
+    Renames and copies are detected, so a moved file shows up as one diff
+    under its new path instead of a deletion plus an addition. Merge commits
+    are skipped unless include_merges is set, in which case their changes
+    relative to the first parent are included.
+
+    The diffs kept for each file are limited to max_diff_bytes (UTF-8) in
+    total, cut on a line boundary; anything past the limit is replaced by a
+    note saying how many bytes were left out. A limit of 0 keeps everything.
+    """
+    history = _scan_history(
+        repo_path, since, include_merges, max_diff_bytes=max_diff_bytes
+    )
+    return _history_in_period(history, None, max_diff_bytes)["file_diffs"]
+
+
+def _diff_section_path(diff_lines):
+    """Get the path a "diff --git" section applies to.
+
+    For renames and copies this is the destination path, taken from the
+    "rename to"/"copy to" line of the extended header. Otherwise both sides
+    of the "diff --git a/<path> b/<path>" header name the same path, so the
+    header can be split down the middle even when the path contains spaces.
+    """
+    for line in diff_lines[1:]:
+        if line.startswith(("rename to ", "copy to ")):
+            return line.split(" ", 2)[2]
+        if line.startswith(("@@", "---", "Binary files")):
+            # End of the extended header
+            break
+
+    paths = diff_lines[0][len("diff --git ") :]
+    old_path = paths[: (len(paths) - 1) // 2]
+
+    # Quoted paths (special characters) look like "a/<path>"
+    if old_path.startswith('"a/'):
+        return '"' + old_path[3:]
+    if old_path.startswith("a/"):
+        return old_path[2:]
+    return old_path
+
+
+def collect_repo_state(
+    repo_path,
+    since,
+    include_merges=False,
+    include_diffs=True,
+    max_diff_bytes=DEFAULT_MAX_DIFF_BYTES,
+):
+    """Collect the git data shown in the commit report.
+
+    Returns a dict with the commit counts, file change statistics, commits
+    grouped by author and file diffs for the period, all from a single pass
+    over the history. The file diffs are None when include_diffs is false.
+    """
+    history = _scan_history(
+        repo_path, since, include_merges, include_diffs, max_diff_bytes
+    )
+    return _history_in_period(history, None, max_diff_bytes)
+
 
-        # Get the list of files changed in this commit
-        files_output = run_git_command(
-            repo_path, "diff-tree", "--no-commit-id", "--name-only", "-r", commit_hash
+def _commit_report_cache_file(repo_path, include_merges, include_diffs, max_diff_bytes):
+    """Return the cache file for the scanned history, or None if HEAD is unknown.
+
+    The history only depends on the repository, the commits reachable from
+    HEAD and the scan options, so all of them are part of the key. The
+    period isn't: an entry holds the history back to the time it was
+    scanned from, and any period starting later is selected from it.
+    """
+    head = run_git_command(repo_path, "rev-parse", "HEAD")
+    if not head:
+        return None
+
+    key = "|".join(
+        str(part)
+        for part in (
+            _CACHE_VERSION,
+            os.path.abspath(repo_path),
+            head,
+            include_merges,
+            include_diffs,
+            max_diff_bytes,
         )
+    )
+    return CACHE_DIR / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.pkl.z"
 
-        if not files_output:
-            continue
 
-        files = files_output.split("\n")
+def _prune_cache(keep=CACHE_MAX_ENTRIES):
+    """Remove all but the keep most recently used commit report cache entries."""
+    entries = []
+    for path in CACHE_DIR.glob("*.pkl.z"):
+        try:
+            entries.append((path.stat().st_mtime, path))
+        except OSError:
+            pass
 
-        for file_path in files:
-            if not file_path.strip():
-                continue
+    entries.sort(reverse=True)
+    for _, path in entries[keep:]:
+        try:
+            path.unlink()
+        except OSError:
+            pass
 
-            # Get the diff for this specific file in this commit
-            diff_output = run_git_command(
-                repo_path, "show", commit_hash, "--", file_path
+
+def get_commit_report_data(
+    repo_path,
+    since,
+    include_merges=False,
+    include_diffs=True,
+    max_diff_bytes=DEFAULT_MAX_DIFF_BYTES,
+    use_cache=True,
+):
+    """Return the commit report data, reusing the on-disk cache when possible.
+
+    A cached history is reused for as long as HEAD doesn't move, whenever it
+    was scanned from no later than the start of the period; the period is
+    then selected from it instead of walking the history again.
+    """
+    options = (include_merges, include_diffs, max_diff_bytes)
+
+    # Pin the period to its start time, so that a fresh scan and a selection
+    # from a cached history use the same window
+    start = _period_start(repo_path, since)
+    if start is not None:
+        since = f"@{start}"
+
+    cache_file = None
+    if use_cache and start is not None:
+        cache_file = _commit_report_cache_file(repo_path, *options)
+
+    if cache_file is not None:
+        try:
+            scanned_from, history = pickle.loads(
+                zlib.decompress(cache_file.read_bytes())
             )
+            if scanned_from <= start:
+                # Mark the entry as recently used for _prune_cache
+                os.utime(cache_file)
+                return _history_in_period(history, start, max_diff_bytes)
+        except (
+            OSError,
+            zlib.error,
+            pickle.UnpicklingError,
+            EOFError,
+            AttributeError,
+            ImportError,
+            TypeError,
+            ValueError,
+        ):
+            pass
 
-            if diff_output:
-                # Get commit info for context
-                commit_info = run_git_command(
-                    repo_path,
-                    "show",
-                    "--no-patch",
-                    "--pretty=format:%h - %s (%ar)",
-                    commit_hash,
-                )
+    history = _scan_history(repo_path, since, *options)
 
-                file_diffs[file_path].append(
-                    {"commit": commit_info, "diff": diff_output}
-                )
+    # Results of a failed git command may be partial, so they aren't kept. A
+    # longer period replaces the entry, as its history covers shorter ones.
+    if cache_file is not None and history["complete"]:
+        data = zlib.compress(pickle.dumps((start, history), protocol=4))
+        if _write_cache_file(cache_file, data):
+            _prune_cache()
+
+    return _history_in_period(history, start, max_diff_bytes)
 
-    return file_diffs
 
+def _write_cache_file(cache_file, data):
+    """Atomically write a cache entry, returning whether it was written.
 
-def generate_platform_summary_report(repo_path, since, period_description):
-    """Generate a high-level summary report with issues and PRs/MRs (supports GitHub and GitLab)."""
+    The data goes to a temporary file that is renamed into place, so a
+    concurrent or interrupted run never sees a partial cache entry.
+    """
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file.write_bytes(data)
+        os.replace(tmp_file, cache_file)
+        return True
+    except OSError:
+        try:
+            tmp_file.unlink()
+        except OSError:
+            pass
+        return False
+
+
+def get_platform_stats(repo_path, since, platform, use_cache=True):
+    """Get issue and PR/MR statistics, reusing results fetched in the last few minutes.
+
+    Issues and PRs change independently of the repository's HEAD, so the
+    cached results are only trusted for PLATFORM_CACHE_TTL seconds.
+
+    Returns:
+        tuple: (issue_stats, pr_stats)
+    """
+    key = "|".join(
+        str(part)
+        for part in (
+            _CACHE_VERSION,
+            os.path.abspath(repo_path),
+            get_repo_url(repo_path),
+            platform,
+            since,
+            calculate_since_date(since),
+        )
+    )
+    cache_file = (
+        CACHE_DIR / f"platform-{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+    )
+
+    if use_cache:
+        try:
+            if time.time() - cache_file.stat().st_mtime < PLATFORM_CACHE_TTL:
+                issue_stats, pr_stats = json_loads(cache_file.read_bytes())
+                return issue_stats, pr_stats
+        except (OSError, ValueError):
+            pass
+
+    if platform == "gitlab":
+        stats = get_gitlab_stats(repo_path, since)
+    else:  # GitHub
+        stats = get_github_stats(repo_path, since)
+
+    if stats is None:
+        # Nothing could be fetched: report no activity, but leave the cache
+        # alone so the next run (e.g. after logging in) asks again
+        issue_stats = {"created": [], "updated": [], "closed": []}
+        pr_stats = {"created": [], "updated": [], "merged": [], "closed": []}
+        return issue_stats, pr_stats
+
+    issue_stats, pr_stats = stats
+
+    if use_cache:
+        data = json.dumps([issue_stats, pr_stats]).encode("utf-8")
+        if _write_cache_file(cache_file, data):
+            _prune_platform_cache()
+
+    return issue_stats, pr_stats
+
+
+def _prune_platform_cache():
+    """Remove platform statistics cache entries that have expired."""
+    for path in CACHE_DIR.glob("platform-*.json"):
+        try:
+            if time.time() - path.stat().st_mtime >= PLATFORM_CACHE_TTL:
+                path.unlink()
+        except OSError:
+            pass
+
+
+def _login(item):
+    """Return the author login of an issue or PR/MR, or "Unknown"."""
+    author = item.get("author")
+    if isinstance(author, dict):
+        return author.get("login", "Unknown")
+    return "Unknown"
+
+
+def generate_platform_summary_report(
+    repo_path, since, period_description, out, use_cache=True, generated_at=None
+):
+    """Write a high-level summary report with issues and PRs/MRs to out (supports GitHub and GitLab).
+
+    generated_at is the datetime shown as the generation time (default: now).
+    """
     repo_name = Path(repo_path).name
     platform = get_repo_platform(repo_path)
 
@@ -850,150 +1644,79 @@ def generate_platform_summary_report(repo_path, since, period_description):
         pr_label_plural = "Pull Requests"
         pr_short = "PR"
 
-    # Start building the markdown report
-    report = []
-    report.append(f"# {platform_name} Activity Summary for {repo_name}")
-    report.append(f"*Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*")
-    report.append("")
-    report.append(f"**Period:** {period_description}")
-    report.append("")
+    # Write the markdown report as it is produced
+    write = out.write
+    if generated_at is None:
+        generated_at = datetime.now()
+    write(f"# {platform_name} Activity Summary for {repo_name}\n")
+    write(f"*Generated on {generated_at.strftime('%Y-%m-%d %H:%M:%S')}*\n")
+    write("\n")
+    write(f"**Period:** {period_description}\n")
+    write("\n")
 
     # Get platform statistics
-    if platform == "gitlab":
-        issue_stats = get_gitlab_issues_stats(repo_path, since)
-        pr_stats = get_gitlab_mr_stats(repo_path, since)
-    else:  # GitHub
-        issue_stats = get_github_issues_stats(repo_path, since)
-        pr_stats = get_github_pr_stats(repo_path, since)
+    issue_stats, pr_stats = get_platform_stats(repo_path, since, platform, use_cache)
 
     # Issues Summary
-    report.append("## Issues Summary")
-    report.append("")
-    report.append(f"- **Issues Created:** {len(issue_stats['created'])}")
-    report.append(f"- **Issues Updated:** {len(issue_stats['updated'])}")
-    report.append(f"- **Issues Closed:** {len(issue_stats['closed'])}")
-    report.append("")
+    write("## Issues Summary\n")
+    write("\n")
+    write(f"- **Issues Created:** {len(issue_stats['created'])}\n")
+    write(f"- **Issues Updated:** {len(issue_stats['updated'])}\n")
+    write(f"- **Issues Closed:** {len(issue_stats['closed'])}\n")
+    write("\n")
 
     # Pull Requests / Merge Requests Summary
-    report.append(f"## {pr_label_plural} Summary")
-    report.append("")
-    report.append(f"- **{pr_short}s Created:** {len(pr_stats['created'])}")
-    report.append(f"- **{pr_short}s Updated:** {len(pr_stats['updated'])}")
-    report.append(f"- **{pr_short}s Merged:** {len(pr_stats['merged'])}")
-    report.append(f"- **{pr_short}s Closed (not merged):** {len(pr_stats['closed'])}")
-    report.append("")
+    write(f"## {pr_label_plural} Summary\n")
+    write("\n")
+    write(f"- **{pr_short}s Created:** {len(pr_stats['created'])}\n")
+    write(f"- **{pr_short}s Updated:** {len(pr_stats['updated'])}\n")
+    write(f"- **{pr_short}s Merged:** {len(pr_stats['merged'])}\n")
+    write(f"- **{pr_short}s Closed (not merged):** {len(pr_stats['closed'])}\n")
+    write("\n")
+
+    def emit(title, items, prefix, url):
+        """Write a titled list of issues or PRs/MRs, or nothing if it is empty."""
+        if not items:
+            return
+
+        write(f"## {title}\n")
+        write("\n")
+        for item in items:
+            number = item["number"]
+            link = f"[{prefix}{number}]({url}{number})" if url else f"{prefix}{number}"
+            write(f"- {link}: {item['title']} (by @{_login(item)})\n")
+        write("\n")
 
     # Detailed Issues List
-    if issue_stats["created"]:
-        report.append("## Issues Created")
-        report.append("")
-        for issue in issue_stats["created"]:
-            author_login = (
-                issue.get("author", {}).get("login", "Unknown")
-                if isinstance(issue.get("author"), dict)
-                else "Unknown"
-            )
-            if repo_url:
-                # GitLab uses /-/issues/, GitHub uses /issues/
-                issue_path = "/-/issues/" if platform == "gitlab" else "/issues/"
-                issue_link = (
-                    f"[#{issue['number']}]({repo_url}{issue_path}{issue['number']})"
-                )
-            else:
-                issue_link = f"#{issue['number']}"
-            report.append(f"- {issue_link}: {issue['title']} (by @{author_login})")
-        report.append("")
-
-    if issue_stats["closed"]:
-        report.append("## Issues Closed")
-        report.append("")
-        for issue in issue_stats["closed"]:
-            author_login = (
-                issue.get("author", {}).get("login", "Unknown")
-                if isinstance(issue.get("author"), dict)
-                else "Unknown"
-            )
-            if repo_url:
-                # GitLab uses /-/issues/, GitHub uses /issues/
-                issue_path = "/-/issues/" if platform == "gitlab" else "/issues/"
-                issue_link = (
-                    f"[#{issue['number']}]({repo_url}{issue_path}{issue['number']})"
-                )
-            else:
-                issue_link = f"#{issue['number']}"
-            report.append(f"- {issue_link}: {issue['title']} (by @{author_login})")
-        report.append("")
+    # GitLab uses /-/issues/, GitHub uses /issues/
+    issue_path = "/-/issues/" if platform == "gitlab" else "/issues/"
+    issue_url = f"{repo_url}{issue_path}" if repo_url else None
+
+    emit("Issues Created", issue_stats["created"], "#", issue_url)
+    emit("Issues Closed", issue_stats["closed"], "#", issue_url)
 
     # Detailed PRs/MRs List
     # Use ! for GitLab MRs, # for GitHub PRs
     pr_prefix = "!" if platform == "gitlab" else "#"
-
-    if pr_stats["created"]:
-        report.append(f"## {pr_label_plural} Created")
-        report.append("")
-        for pr in pr_stats["created"]:
-            author_login = (
-                pr.get("author", {}).get("login", "Unknown")
-                if isinstance(pr.get("author"), dict)
-                else "Unknown"
-            )
-            if repo_url:
-                # GitLab uses /-/merge_requests/, GitHub uses /pull/
-                pr_path = "/-/merge_requests/" if platform == "gitlab" else "/pull/"
-                pr_link = (
-                    f"[{pr_prefix}{pr['number']}]({repo_url}{pr_path}{pr['number']})"
-                )
-            else:
-                pr_link = f"{pr_prefix}{pr['number']}"
-            report.append(f"- {pr_link}: {pr['title']} (by @{author_login})")
-        report.append("")
-
-    if pr_stats["merged"]:
-        report.append(f"## {pr_label_plural} Merged")
-        report.append("")
-        for pr in pr_stats["merged"]:
-            author_login = (
-                pr.get("author", {}).get("login", "Unknown")
-                if isinstance(pr.get("author"), dict)
-                else "Unknown"
-            )
-            if repo_url:
-                # GitLab uses /-/merge_requests/, GitHub uses /pull/
-                pr_path = "/-/merge_requests/" if platform == "gitlab" else "/pull/"
-                pr_link = (
-                    f"[{pr_prefix}{pr['number']}]({repo_url}{pr_path}{pr['number']})"
-                )
-            else:
-                pr_link = f"{pr_prefix}{pr['number']}"
-            report.append(f"- {pr_link}: {pr['title']} (by @{author_login})")
-        report.append("")
-
-    if pr_stats["closed"]:
-        report.append(f"## {pr_label_plural} Closed (not merged)")
-        report.append("")
-        for pr in pr_stats["closed"]:
-            author_login = (
-                pr.get("author", {}).get("login", "Unknown")
-                if isinstance(pr.get("author"), dict)
-                else "Unknown"
-            )
-            if repo_url:
-                # GitLab uses /-/merge_requests/, GitHub uses /pull/
-                pr_path = "/-/merge_requests/" if platform == "gitlab" else "/pull/"
-                pr_link = (
-                    f"[{pr_prefix}{pr['number']}]({repo_url}{pr_path}{pr['number']})"
-                )
-            else:
-                pr_link = f"{pr_prefix}{pr['number']}"
-            report.append(f"- {pr_link}: {pr['title']} (by @{author_login})")
-        report.append("")
-
-    return "\n".join(report)
+    # GitLab uses /-/merge_requests/, GitHub uses /pull/
+    pr_path = "/-/merge_requests/" if platform == "gitlab" else "/pull/"
+    pr_url = f"{repo_url}{pr_path}" if repo_url else None
+
+    emit(f"{pr_label_plural} Created", pr_stats["created"], pr_prefix, pr_url)
+    emit(f"{pr_label_plural} Merged", pr_stats["merged"], pr_prefix, pr_url)
+    emit(
+        f"{pr_label_plural} Closed (not merged)",
+        pr_stats["closed"],
+        pr_prefix,
+        pr_url,
+    )
 
 
 def generate_github_summary_report(repo_path, since, period_description):
     """Generate a high-level GitHub summary report (deprecated - use generate_platform_summary_report)."""
-    return generate_platform_summary_report(repo_path, since, period_description)
+    report = io.StringIO()
+    generate_platform_summary_report(repo_path, since, period_description, report)
+    return report.getvalue()
 
 
 def show_help():
@@ -1012,6 +1735,13 @@ OPTIONS:
     --time-range RANGE      Time period for the report (default: 1.week)
     --output-dir DIR        Directory where reports will be saved (default: current directory)
     --report-type TYPE      Type of report to generate: all, commits, platform (default: all)
+    --include-merges        Include merge commits (against their first parent) in the file diffs
+    --max-diff-bytes N      Limit the diffs shown for each file to N bytes (default: 262144, 0 for no limit)
+    --no-diffs              Leave the file diffs out of the commit report
+    --top N                 Only show the commits of the N most active authors and the diffs
+                            of the N most often changed files
+    --no-precompute         Skip writing Git's commit-graph before scanning history
+    --no-cache              Recompute everything instead of using the on-disk cache
     -h, --help              Show this help message
 
 TIME RANGE OPTIONS:
@@ -1068,103 +1798,177 @@ OUTPUT:
     print(help_text)
 
 
-def generate_markdown_report(repo_path, since, period_description):
-    """Generate a markdown report of git commits for the specified time period."""
+def generate_markdown_report(
+    repo_path,
+    since,
+    period_description,
+    out,
+    include_merges=False,
+    include_diffs=True,
+    max_diff_bytes=DEFAULT_MAX_DIFF_BYTES,
+    use_cache=True,
+    generated_at=None,
+    top=None,
+):
+    """Write a markdown report of git commits for the specified time period to out.
+
+    generated_at is the datetime shown as the generation time (default: now);
+    commit ages are given relative to it. When top is set, only the top
+    authors by commit count and the top files by number of changes are
+    shown, most active first.
+    """
     repo_name = Path(repo_path).name
 
     # Get the repository URL (supports GitHub, GitLab, and self-hosted instances)
     repo_url = get_repo_url(repo_path)
 
-    # Start building the markdown report
-    report = []
-    report.append(f"# Git Commit Report for {repo_name}")
-    report.append(f"*Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*")
-    report.append("")
-    report.append(f"**Period:** {period_description}")
-    report.append("")
+    # Write the markdown report as it is produced
+    write = out.write
+    if generated_at is None:
+        generated_at = datetime.now()
+    now = int(generated_at.timestamp())
+    write(f"# Git Commit Report for {repo_name}\n")
+    write(f"*Generated on {generated_at.strftime('%Y-%m-%d %H:%M:%S')}*\n")
+    write("\n")
+    write(f"**Period:** {period_description}\n")
+    write("\n")
+
+    # Get the git data for the period (cached while HEAD doesn't move)
+    data = get_commit_report_data(
+        repo_path, since, include_merges, include_diffs, max_diff_bytes, use_cache
+    )
 
     # Get commit counts
-    commit_counts = get_commit_counts(repo_path, since)
+    commit_counts = data["commit_counts"]
 
     if not commit_counts:
-        report.append("No commits found in the specified period.")
-        return "\n".join(report)
+        write("No commits found in the specified period.\n")
+        return
 
     # Get file change statistics
-    file_stats = get_file_change_stats(repo_path, since)
+    file_stats = data["file_stats"]
 
     # Display file change statistics at the top
-    report.append("## File Changes")
-    report.append("")
-    report.append(f"- **Files Added:** {file_stats['added']}")
-    report.append(f"- **Files Modified:** {file_stats['modified']}")
-    report.append(f"- **Files Deleted:** {file_stats['deleted']}")
-    report.append("")
+    write("## File Changes\n")
+    write("\n")
+    write(f"- **Files Added:** {file_stats['added']}\n")
+    write(f"- **Files Modified:** {file_stats['modified']}\n")
+    write(f"- **Files Deleted:** {file_stats['deleted']}\n")
+    write("\n")
 
     # Section 1: Commit counts by user
-    report.append("## Commit Summary")
-    report.append("")
-    report.append("| Commits | Author |")
-    report.append("|---------|--------|")
+    write("## Commit Summary\n")
+    write("\n")
+    write("| Commits | Author |\n")
+    write("|---------|--------|\n")
 
     for count, author in commit_counts:
-        report.append(f"| {count} | {author} |")
+        write(f"| {count} | {author} |\n")
 
-    report.append("")
+    write("\n")
 
     # Section 2: Commit information grouped by user
-    report.append("## Commits by Author")
-    report.append("")
+    write("## Commits by Author\n")
+    write("\n")
 
-    commits_by_author = get_detailed_commits(repo_path, since)
+    commits_by_author = data["commits_by_author"]
 
-    for author, commits in sorted(commits_by_author.items()):
-        report.append(f"### {author}")
-        report.append("")
+    if repo_url:
+        # GitLab uses /-/commit/, GitHub uses /commit/
+        commit_path = "/-/commit/" if "gitlab" in repo_url else "/commit/"
+        link_prefix = f"{repo_url}{commit_path}"
+    else:
+        link_prefix = None
+
+    if top:
+        authors = heapq.nlargest(
+            top, commits_by_author, key=lambda author: len(commits_by_author[author])
+        )
+    else:
+        authors = sorted(commits_by_author, key=str.lower)
+
+    for author in authors:
+        commits = commits_by_author[author]
+        write(f"### {author}\n")
+        write("\n")
 
         for commit in commits:
-            if repo_url:
-                # GitLab uses /-/commit/, GitHub uses /commit/
-                commit_path = "/-/commit/" if "gitlab" in repo_url else "/commit/"
-                commit_link = (
-                    f"[{commit['hash']}]({repo_url}{commit_path}{commit['hash']})"
-                )
+            if link_prefix:
+                commit_link = f"[{commit.hash}]({link_prefix}{commit.hash})"
             else:
-                commit_link = f"[{commit['hash']}]"
-            report.append(f"- {commit_link} {commit['subject']} *({commit['date']})*")
+                commit_link = f"[{commit.hash}]"
+            commit_date = format_relative_date(commit.time, now)
+            write(f"- {commit_link} {commit.subject} *({commit_date})*\n")
 
-        report.append("")
-        report.append("---")
-        report.append("")
+        write("\n")
+        write("---\n")
+        write("\n")
 
-    # Section 3: File diffs for all changed files
-    report.append("## File Diffs")
-    report.append("")
-    report.append("All changes to files in the specified period:")
-    report.append("")
+    # Section 3: File diffs for all changed files (left out with --no-diffs)
+    file_diffs = data["file_diffs"]
+    if file_diffs is None:
+        return
 
-    file_diffs = get_file_diffs(repo_path, since)
+    write("## File Diffs\n")
+    write("\n")
+    write("All changes to files in the specified period:\n")
+    write("\n")
 
     if file_diffs:
-        for file_path in sorted(file_diffs.keys()):
-            report.append(f"### {file_path}")
-            report.append("")
+        if top:
+            file_paths = heapq.nlargest(
+                top, file_diffs, key=lambda file_path: len(file_diffs[file_path])
+            )
+        else:
+            file_paths = sorted(file_diffs)
+
+        for file_path in file_paths:
+            write(f"### {file_path}\n")
+            write("\n")
 
             for diff_info in file_diffs[file_path]:
-                report.append(f"**Commit:** {diff_info['commit']}")
-                report.append("")
-                report.append("```diff")
-                report.append(diff_info["diff"])
-                report.append("```")
-                report.append("")
-
-            report.append("---")
-            report.append("")
+                commit_date = format_relative_date(diff_info["time"], now)
+                write(f"**Commit:** {diff_info['commit']} ({commit_date})\n")
+                write("\n")
+                write("```diff\n")
+                write(f"{diff_info['diff']}\n")
+                write("```\n")
+                write("\n")
+
+            write("---\n")
+            write("\n")
     else:
-        report.append("No file changes found in the specified period.")
-        report.append("")
+        write("No file changes found in the specified period.\n")
+        write("\n")
+
 
-    return "\n".join(report)
+def write_report_file(output_file, generate, repo_path, since, period_description):
+    """Stream a report from generate straight into output_file as UTF-8.
+
+    The report is never held in memory as a whole; its sections go to the
+    file through a large buffer as they are produced. Newlines are written
+    as-is, so reports have LF line endings on every platform and the text
+    layer doesn't translate them on Windows. Like cache entries, the report
+    goes to a temporary file that is renamed into place once complete, so
+    a failed or interrupted run never leaves a truncated report behind.
+    """
+    tmp_file = output_file.with_name(f"{output_file.name}.{os.getpid()}.tmp")
+    try:
+        with open(
+            tmp_file,
+            "w",
+            encoding="utf-8",
+            newline="\n",
+            buffering=REPORT_BUFFER_SIZE,
+        ) as out:
+            generate(repo_path, since, period_description, out)
+        os.replace(tmp_file, output_file)
+    except BaseException:
+        try:
+            tmp_file.unlink()
+        except OSError:
+            pass
+        raise
 
 
 def main():
@@ -1191,6 +1995,39 @@ def main():
         default="all",
         help="Type of report to generate (default: all)",
     )
+    parser.add_argument(
+        "--include-merges",
+        action="store_true",
+        help="Include merge commits (against their first parent) in the file diffs",
+    )
+    parser.add_argument(
+        "--max-diff-bytes",
+        type=int,
+        default=DEFAULT_MAX_DIFF_BYTES,
+        help="Limit the diffs shown for each file to this many bytes (0 for no limit)",
+    )
+    parser.add_argument(
+        "--no-diffs",
+        action="store_true",
+        help="Leave the file diffs out of the commit report",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        metavar="N",
+        help="Only show the commits of the N most active authors and the diffs of "
+        "the N most often changed files",
+    )
+    parser.add_argument(
+        "--no-precompute",
+        action="store_true",
+        help="Skip writing Git's commit-graph before scanning history",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Recompute everything instead of using the on-disk cache",
+    )
     parser.add_argument("-h", "--help", action="store_true", help="Show help message")
 
     # Parse arguments
@@ -1210,16 +2047,59 @@ def main():
     if report_type == "github":
         report_type = "platform"
 
-    # Check if the path is a valid git repository
-    if not Path(repo_path).is_dir():
-        print(f"Error: {repo_path} is not a valid directory.")
+    if args.max_diff_bytes < 0:
+        print("Error: --max-diff-bytes must be 0 or a positive number of bytes.")
         sys.exit(1)
 
-    git_dir = Path(repo_path) / ".git"
-    if not git_dir.exists():
-        print(f"Error: {repo_path} is not a valid Git repository.")
+    if args.top is not None and args.top < 1:
+        print("Error: --top must be a positive number.")
         sys.exit(1)
 
+    # Make the path absolute once, so that equivalent spellings of it share
+    # the memoized git, remote URL and platform lookups
+    repo_path = os.path.abspath(repo_path)
+
+    # Check if the path is a valid git repository. Asking git covers linked
+    # worktrees and submodules (where .git is a file) as well; the path is
+    # only inspected further to explain a failure. git's own error is
+    # discarded, since the messages below say what went wrong.
+    probe = subprocess.run(
+        ["git", "-C", repo_path, "rev-parse", "--git-dir"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    if probe.returncode != 0:
+        if not os.path.isdir(repo_path):
+            print(f"Error: {repo_path} is not a valid directory.")
+        else:
+            print(f"Error: {repo_path} is not a valid Git repository.")
+        sys.exit(1)
+
+    # Fail clearly up front rather than on git's "unknown option" midway
+    if args.include_merges:
+        git_version = get_git_version(repo_path)
+        if git_version is not None and git_version < MIN_GIT_VERSION_FOR_MERGES:
+            print(
+                "Error: --include-merges requires Git "
+                f"{'.'.join(map(str, MIN_GIT_VERSION_FOR_MERGES))} or later."
+            )
+            sys.exit(1)
+
+    # Write the commit-graph (with changed-path Bloom filters) so the history
+    # scans below can walk commits without parsing every commit object. With
+    # --split only commits missing from the graph are written, as a new
+    # layer, so runs against an unchanged repository skip the rewrite. The
+    # platform summary never walks history, so it leaves the graph alone.
+    if not args.no_precompute and report_type in ["all", "commits"]:
+        run_git_command(
+            repo_path,
+            "commit-graph",
+            "write",
+            "--reachable",
+            "--changed-paths",
+            "--split",
+        )
+
     # Validate and create output directory if needed
     output_path = Path(output_dir).expanduser().resolve()
     if not output_path.exists():
@@ -1233,42 +2113,42 @@ def main():
         sys.exit(1)
 
     # Create a human-readable period description
-    period_map = {
-        "1.week": "Last 7 days",
-        "2.weeks": "Last 14 days",
-        "1.month": "Last 30 days",
-        "2.months": "Last 60 days",
-        "3.months": "Last 90 days",
-        "6.months": "Last 180 days",
-        "1.year": "Last 365 days",
-    }
-    period_description = period_map.get(since, f"Since {since}")
+    period_description = PERIOD_DESCRIPTIONS.get(since, f"Since {since}")
 
     # Create a filename-friendly version of the time range
-    filename_period = since.replace(".", "")
+    filename_period = since.translate(_NO_DOT)
     repo_name = Path(repo_path).name
-    current_date = datetime.now().strftime("%Y%m%d")
 
-    # Generate and save reports based on report type
-    generated_reports = []
+    # Both reports share one timestamp, so their file names and "Generated
+    # on" lines always agree
+    generated_at = datetime.now()
+    current_date = generated_at.strftime("%Y%m%d")
+
+    # Work out which reports to generate as (label, generator, output file)
+    report_jobs = []
 
     if report_type in ["all", "commits"]:
-        # Generate the commit report
         print(f"Generating commit report for {repo_name}...")
-        commit_report = generate_markdown_report(repo_path, since, period_description)
 
         # Create output filename
         commit_filename = (
             f"{current_date}_{repo_name}_{filename_period}_commit_report.md"
         )
-        commit_output_file = output_path / commit_filename
-
-        # Write report to file
-        with open(commit_output_file, "w") as f:
-            f.write(commit_report)
-
-        generated_reports.append(str(commit_output_file))
-        print(f"✓ Commit report generated: {commit_output_file}")
+        report_jobs.append(
+            (
+                "Commit report",
+                partial(
+                    generate_markdown_report,
+                    include_merges=args.include_merges,
+                    include_diffs=not args.no_diffs,
+                    max_diff_bytes=args.max_diff_bytes,
+                    use_cache=not args.no_cache,
+                    generated_at=generated_at,
+                    top=args.top,
+                ),
+                output_path / commit_filename,
+            )
+        )
 
     if report_type in ["all", "platform"]:
         # Check if this is a GitHub or GitLab repository
@@ -1283,25 +2163,54 @@ def main():
                 )
                 sys.exit(1)
         else:
-            # Generate the platform summary report
             platform_name = "GitHub" if platform == "github" else "GitLab"
             print(f"Generating {platform_name} summary for {repo_name}...")
-            platform_report = generate_platform_summary_report(
-                repo_path, since, period_description
-            )
 
             # Create output filename
             platform_filename = (
                 f"{current_date}_{repo_name}_{filename_period}_{platform}_summary.md"
             )
-            platform_output_file = output_path / platform_filename
+            report_jobs.append(
+                (
+                    f"{platform_name} summary",
+                    partial(
+                        generate_platform_summary_report,
+                        use_cache=not args.no_cache,
+                        generated_at=generated_at,
+                    ),
+                    output_path / platform_filename,
+                )
+            )
 
-            # Write report to file
-            with open(platform_output_file, "w") as f:
-                f.write(platform_report)
+    # Generate the reports straight into their files. The commit report
+    # waits on local git and the platform summary on the network, so when
+    # both are requested they are generated in parallel.
+    if len(report_jobs) > 1:
+        with ProcessPoolExecutor(max_workers=len(report_jobs)) as executor:
+            futures = [
+                executor.submit(
+                    write_report_file,
+                    output_file,
+                    generate,
+                    repo_path,
+                    since,
+                    period_description,
+                )
+                for _, generate, output_file in report_jobs
+            ]
+            for future in futures:
+                future.result()
+    else:
+        for _, generate, output_file in report_jobs:
+            write_report_file(
+                output_file, generate, repo_path, since, period_description
+            )
+
+    generated_reports = []
 
-            generated_reports.append(str(platform_output_file))
-            print(f"✓ {platform_name} summary generated: {platform_output_file}")
+    for label, _, output_file in report_jobs:
+        generated_reports.append(str(output_file))
+        print(f"✓ {label} generated: {output_file}")
 
     # Summary
     print(f"\n{'=' * 60}")